@@ -2,11 +2,16 @@
 """Build a polished PowerPoint from Elli's Phone Safety Course."""
 
 from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
+from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 import copy
+import re
+from functools import lru_cache
+from xml.sax.saxutils import escape
 
 # ── Colors ──
 BG = RGBColor(0x1a, 0x1a, 0x2e)
@@ -18,8 +23,14 @@ TEAL = RGBColor(0x06, 0xb6, 0xd4)
 PINK = RGBColor(0xe0, 0x56, 0xa0)
 WARN = RGBColor(0xff, 0x6b, 0x6b)
 GREEN = RGBColor(0x2c, 0xb6, 0x7d)
+DISCUSSION_BG = RGBColor(0x1f, 0x1a, 0x3e)
+SAFE_BOX_BG = RGBColor(0x15, 0x2a, 0x1f)
+WARN_BOX_BG = RGBColor(0x2e, 0x1a, 0x1a)
 
 FONT = 'Calibri'
+# Plain ints for add_shape; resolved once rather than per call.
+_ROUNDED_RECT = int(MSO_SHAPE.ROUNDED_RECTANGLE)
+_RECT = int(MSO_SHAPE.RECTANGLE)
 SLIDE_W = Inches(13.333)
 SLIDE_H = Inches(7.5)
 
@@ -29,46 +40,205 @@ prs.slide_height = SLIDE_H
 
 # Use blank layout
 blank_layout = prs.slide_layouts[6]
+# Dark background, set once on the master: every layout inherits it, so the
+# slides need no background of their own.
+prs.slide_masters[0].background.fill.solid()
+prs.slide_masters[0].background.fill.fore_color.rgb = BG
+# Likewise the typeface: text boxes inherit it from the presentation's default
+# text style (or the master's style for other text), so name FONT there once
+# and leave it off every paragraph and run.
+for latin in (prs.part._element.xpath('./p:defaultTextStyle//a:latin')
+              + prs.slide_masters[0]._element.xpath('./p:txStyles/p:otherStyle//a:latin')):
+    latin.set('typeface', FONT)
 
 slide_number_counter = [0]
 
+# Inches()/Pt() allocate a new Length on every call; the helpers below reuse
+# the same handful of values hundreds of times, so memoize them.
+@lru_cache(maxsize=None)
+def _in(x):
+    return Inches(x)
+
+@lru_cache(maxsize=None)
+def _pt(x):
+    return Pt(x)
+
+EMU_005 = _in(0.05)
+EMU_01 = _in(0.1)
+IN_1_5 = _in(1.5)
+IN_10_333 = _in(10.333)
+_PT6 = _pt(6)
+_PT2 = _pt(2)
+
+# Every slide gets the same slide-number footer. Build it once on a scratch
+# slide (in a throwaway presentation, so it never ends up in the deck) and
+# deep-copy the XML into each new slide.
+# copy.deepcopy on an lxml element is a C-level subtree copy: about 5us for
+# the footer, against 12us for parse_xml() of the same XML cached as bytes
+# and 18us for a tostring()/parse_xml() round trip.
+_scratch_prs = Presentation()
+_proto_slide = _scratch_prs.slides.add_slide(_scratch_prs.slide_layouts[6])
+_footer = _proto_slide.shapes.add_textbox(_in(12.3), _in(7.0), _in(0.8), _in(0.4))
+p = _footer.text_frame.paragraphs[0]
+p.text = '0'
+p.font.size = _pt(10)
+p.font.color.rgb = DIM
+p.alignment = PP_ALIGN.RIGHT
+_FOOTER_PROTO = _footer._element
+
+# Callout and discussion boxes are likewise cloned from prototypes; only
+# their position (and the accent bar's color) differs per use.
+shape = _proto_slide.shapes.add_shape(_ROUNDED_RECT, 0, 0, 0, 0)
+shape.fill.solid()
+shape.fill.fore_color.rgb = BG_SURFACE
+shape.line.fill.background()
+_CALLOUT_BOX_PROTO = shape._element
+shape = _proto_slide.shapes.add_shape(_RECT, 0, 0, 0, 0)
+shape.fill.solid()
+shape.fill.fore_color.rgb = PURPLE
+shape.line.fill.background()
+_CALLOUT_BAR_PROTO = shape._element
+shape = _proto_slide.shapes.add_shape(_ROUNDED_RECT, 0, 0, 0, 0)
+shape.fill.solid()
+shape.fill.fore_color.rgb = DISCUSSION_BG
+shape.line.color.rgb = PURPLE
+shape.line.width = _pt(2)
+_DISCUSSION_BOX_PROTO = shape._element
+
 def add_slide():
-    slide = prs.slides.add_slide(blank_layout)
-    # Dark background
-    bg = slide.background
-    fill = bg.fill
-    fill.solid()
-    fill.fore_color.rgb = BG
+    # Same as prs.slides.add_slide(blank_layout) minus the placeholder-cloning
+    # pass, which walks the layout's date/footer/number placeholders only to
+    # skip them all: the blank layout has nothing to clone.
+    rId, slide = prs.part.add_slide(blank_layout)
+    prs.slides._sldIdLst.add_sldId(rId)
     slide_number_counter[0] += 1
     # Slide number
-    txBox = slide.shapes.add_textbox(Inches(12.3), Inches(7.0), Inches(0.8), Inches(0.4))
-    tf = txBox.text_frame
-    p = tf.paragraphs[0]
-    p.text = str(slide_number_counter[0])
-    p.font.size = Pt(10)
-    p.font.color.rgb = DIM
-    p.font.name = FONT
-    p.alignment = PP_ALIGN.RIGHT
+    footer = copy.deepcopy(_FOOTER_PROTO)
+    footer[-1][-1][-1][-1].text = str(slide_number_counter[0])  # txBody/p/r/t
+    slide._element.cSld.spTree.append(footer)
+    # Every helper adds shapes through this one Slide object, so let its
+    # shape collection hand out ids from a cached counter instead of
+    # re-scanning all ids in the slide for each new shape.
+    slide.shapes.turbo_add_enabled = True
     return slide
 
+def clone_shape(slide, proto, left, top, width, height):
+    """Append a copy of prototype `p:sp` element `proto` to `slide`, giving it a
+    fresh id and name the way `add_shape` would. Returns the new element."""
+    shapes = slide.shapes
+    sp = copy.deepcopy(proto)
+    id_ = shapes._next_shape_id
+    # Patch the copy through fixed child paths rather than the oxml
+    # properties, which look each child up by tag and validate every value.
+    cNvPr = sp[0][0]  # nvSpPr/cNvPr
+    cNvPr.set('id', str(id_))
+    cNvPr.set('name', '%s %d' % (cNvPr.get('name').rsplit(' ', 1)[0], id_ - 1))
+    off, ext = sp[1][0]  # spPr/xfrm
+    off.set('x', str(left))
+    off.set('y', str(top))
+    ext.set('cx', str(width))
+    ext.set('cy', str(height))
+    shapes._spTree.insert_element_before(sp, 'p:extLst')
+    return sp
+
+# The complete <p:sp> of a word-wrapped text box, and of one uniformly
+# formatted paragraph. Text boxes are created a few hundred times per build,
+# so filling in these strings and parsing each box once is much cheaper than
+# add_textbox plus the word-wrap, paragraph and font setters.
+_TEXTBOX_TMPL = (
+    '<p:sp %s><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {n}"/><p:cNvSpPr txBox="1"/><p:nvPr/>'
+    '</p:nvSpPr><p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '{paragraphs}</p:txBody></p:sp>' % nsdecls('p', 'a')
+)
+_TEXT_P_HEAD = (
+    '<a:p><a:pPr algn="{algn}"{margins}>{spacing}<a:defRPr sz="{sz}" b="{b}"><a:solidFill>'
+    '<a:srgbClr val="{color}"/></a:solidFill>{font}</a:defRPr></a:pPr>'
+)
+
+def add_text_frame(slide, left, top, width, height, paragraphs='<a:p/>'):
+    """Add a word-wrapped text box containing `paragraphs` (`<a:p>` XML) and
+    return its text frame."""
+    shapes = slide.shapes
+    id_ = shapes._next_shape_id
+    sp = parse_xml(_TEXTBOX_TMPL.format(
+        id=id_, n=id_ - 1, x=left, y=top, cx=width, cy=height, paragraphs=paragraphs))
+    shapes._spTree.insert_element_before(sp, 'p:extLst')
+    return shapes._shape_factory(sp).text_frame
+
+# A borderless, unfilled one-column table ("No Style, No Grid"), used to
+# stack short uniformly spaced lines in a single shape rather than one text
+# box per line. Cells keep the text box's left/right inset but none above
+# or below, so the row height alone sets the line pitch.
+_TABLE_TMPL = (
+    '<p:graphicFrame %s><p:nvGraphicFramePr><p:cNvPr id="{id}" name="Table {n}"/>'
+    '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/>'
+    '</p:nvGraphicFramePr><p:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></p:xfrm>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+    '<a:tbl><a:tblPr><a:tableStyleId>{{2D5ABB26-0587-4C30-8999-92F81FD0307C}}</a:tableStyleId></a:tblPr>'
+    '<a:tblGrid><a:gridCol w="{cx}"/></a:tblGrid>{rows}</a:tbl></a:graphicData></a:graphic>'
+    '</p:graphicFrame>' % nsdecls('p', 'a')
+)
+_TABLE_ROW_TMPL = (
+    '<a:tr h="%d"><a:tc><a:txBody><a:bodyPr/><a:lstStyle/>%s</a:txBody>'
+    '<a:tcPr marT="0" marB="0"/></a:tc></a:tr>'
+)
+
+def add_table_rows(slide, left, top, width, row_height, paragraphs):
+    """Add a one-column table with a `row_height` row for each `<a:p>` XML
+    string in `paragraphs` and return the table."""
+    shapes = slide.shapes
+    id_ = shapes._next_shape_id
+    frame = parse_xml(_TABLE_TMPL.format(
+        id=id_, n=id_ - 1, x=left, y=top, cx=width, cy=row_height * len(paragraphs),
+        rows=''.join(_TABLE_ROW_TMPL % (row_height, p) for p in paragraphs)))
+    shapes._spTree.insert_element_before(frame, 'p:extLst')
+    return shapes._shape_factory(frame).table
+
+def runs_xml(text):
+    """`<a:r>`/`<a:br/>` XML for `text`, split on line breaks the same way
+    python-pptx's paragraph text setter does."""
+    xml = []
+    for i, line in enumerate(re.split('\n|\v', text)):
+        if i:
+            xml.append('<a:br/>')
+        if line:
+            xml.append('<a:r><a:t>%s</a:t></a:r>' % escape(line))
+    return ''.join(xml)
+
+def margins_xml(indent):
+    """`a:pPr` attributes insetting a paragraph by `indent` on both sides."""
+    return ' marL="%d" marR="%d"' % (indent, indent) if indent else ''
+
+# Only about thirty styles occur across the whole deck, so each opening tag
+# is formatted once and reused for every paragraph in that style.
+@lru_cache(maxsize=None)
+def paragraph_head_xml(font_size=28, color=WHITE, bold=False, alignment=PP_ALIGN.LEFT, font_name=FONT,
+                       indent=None, space_before=None):
+    """Opening `<a:p>` and `<a:pPr>` XML for a paragraph in a single style;
+    close it with its runs and `</a:p>`."""
+    return _TEXT_P_HEAD.format(
+        algn=alignment.xml_value, margins=margins_xml(indent),
+        spacing='<a:spcBef><a:spcPts val="%d"/></a:spcBef>' % space_before.centipoints if space_before else '',
+        sz=_pt(font_size).centipoints, b=int(bool(bold)), color=color,
+        font='' if font_name == FONT else '<a:latin typeface="%s"/>' % font_name)
+
+def paragraph_xml(text, font_size=28, color=WHITE, bold=False, alignment=PP_ALIGN.LEFT, font_name=FONT,
+                  indent=None, space_before=None):
+    """`<a:p>` XML for `text` in a single style, optionally inset by `indent`
+    on both sides and set `space_before` below the previous paragraph."""
+    return '%s%s</a:p>' % (
+        paragraph_head_xml(font_size, color, bold, alignment, font_name, indent, space_before),
+        runs_xml(text))
+
 def add_text(slide, left, top, width, height, text, font_size=28, color=WHITE, bold=False, alignment=PP_ALIGN.LEFT, font_name=FONT):
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(font_size)
-    p.font.color.rgb = color
-    p.font.bold = bold
-    p.font.name = font_name
-    p.alignment = alignment
-    return tf
+    return add_text_frame(slide, left, top, width, height,
+                          paragraph_xml(text, font_size, color, bold, alignment, font_name))
 
 def add_rich_text(slide, left, top, width, height, runs, alignment=PP_ALIGN.LEFT):
     """runs = list of (text, size, color, bold)"""
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
+    tf = add_text_frame(slide, left, top, width, height)
     p = tf.paragraphs[0]
     p.alignment = alignment
     for i, (text, size, color, bold) in enumerate(runs):
@@ -78,135 +248,198 @@ def add_rich_text(slide, left, top, width, height, runs, alignment=PP_ALIGN.LEFT
         else:
             run = p.add_run()
             run.text = text
-        run.font.size = Pt(size)
+        run.font.size = _pt(size)
         run.font.color.rgb = color
         run.font.bold = bold
-        run.font.name = FONT
     return tf
 
 def add_bullets(slide, left, top, width, height, items, font_size=26, icon_color=PURPLE):
-    """items = list of (emoji, text)"""
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    for i, (emoji, text) in enumerate(items):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.space_after = Pt(6)
-        p.space_before = Pt(2)
-        run = p.add_run()
-        run.text = f"{emoji}  {text}"
-        run.font.size = Pt(font_size)
-        run.font.color.rgb = WHITE
-        run.font.name = FONT
-    return tf
+    """items = sequence of (emoji, text)"""
+    return add_text_frame(slide, left, top, width, height, bullets_xml(items, font_size) or '<a:p/>')
+
+# One bullet paragraph; only the text varies between items, so everything up
+# to the <a:t> is formatted once per call.
+_BULLET_P_HEAD = (
+    '<a:p><a:pPr{margins}>'
+    '<a:spcBef><a:spcPts val="200"/></a:spcBef><a:spcAft><a:spcPts val="600"/></a:spcAft>'
+    '</a:pPr><a:r><a:rPr sz="{sz}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    '</a:rPr><a:t>'
+)
+_BULLET_P_TAIL = '</a:t></a:r></a:p>'
+
+def bullets_xml(items, font_size=26, indent=None):
+    """`<a:p>` XML with one paragraph per (emoji, text) item, optionally
+    inset by `indent` on both sides."""
+    head = _BULLET_P_HEAD.format(
+        margins=margins_xml(indent), sz=_pt(font_size).centipoints, color=WHITE)
+    return ''.join('%s%s  %s%s' % (head, escape(emoji), escape(text), _BULLET_P_TAIL)
+                   for emoji, text in items)
+
+# Offsets of the label/text boxes inside a callout or discussion box.
+_CALLOUT_BAR_W = _in(0.08)
+_CALLOUT_TEXT_DX = _in(0.25)
+_CALLOUT_TEXT_W_SHRINK = _in(0.4)
+_CALLOUT_LABEL_DY = _in(0.1)
+_CALLOUT_LABEL_H = _in(0.3)
+_CALLOUT_TEXT_DY = _in(0.38)
+_CALLOUT_TEXT_H_SHRINK = _in(0.5)
+_DISCUSSION_TEXT_DX = _in(0.3)
+_DISCUSSION_TEXT_W_SHRINK = _in(0.6)
+_DISCUSSION_LABEL_DY = _in(0.2)
+_DISCUSSION_LABEL_H = _in(0.4)
+_DISCUSSION_TEXT_DY = _in(0.55)
+_DISCUSSION_TEXT_H_SHRINK = _in(0.7)
 
 def add_callout(slide, left, top, width, height, label, text, label_color=PINK, border_color=PURPLE):
     """Callout box with colored left border effect."""
     # Background shape
-    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = BG_SURFACE
-    shape.line.fill.background()
+    clone_shape(slide, _CALLOUT_BOX_PROTO, left, top, width, height)
     # Accent bar
-    bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top + Emu(Inches(0.05).emu), Inches(0.08), height - Emu(Inches(0.1).emu))
-    bar.fill.solid()
-    bar.fill.fore_color.rgb = border_color
-    bar.line.fill.background()
+    bar = clone_shape(slide, _CALLOUT_BAR_PROTO, left, top + EMU_005, _CALLOUT_BAR_W, height - EMU_01)
+    bar[1][2][0].set('val', str(border_color))  # spPr/solidFill/srgbClr
+    x = left + _CALLOUT_TEXT_DX
+    w = width - _CALLOUT_TEXT_W_SHRINK
     # Label
-    add_text(slide, left + Inches(0.25), top + Inches(0.1), width - Inches(0.4), Inches(0.3),
+    add_text(slide, x, top + _CALLOUT_LABEL_DY, w, _CALLOUT_LABEL_H,
              label.upper(), font_size=12, color=label_color, bold=True)
     # Text
-    add_text(slide, left + Inches(0.25), top + Inches(0.38), width - Inches(0.4), height - Inches(0.5),
+    add_text(slide, x, top + _CALLOUT_TEXT_DY, w, height - _CALLOUT_TEXT_H_SHRINK,
              text, font_size=18, color=DIM)
 
 def add_discussion(slide, left, top, width, height, question):
-    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x1f, 0x1a, 0x3e)
-    shape.line.color.rgb = PURPLE
-    shape.line.width = Pt(2)
-    add_text(slide, left + Inches(0.3), top + Inches(0.2), width - Inches(0.6), Inches(0.4),
+    clone_shape(slide, _DISCUSSION_BOX_PROTO, left, top, width, height)
+    x = left + _DISCUSSION_TEXT_DX
+    w = width - _DISCUSSION_TEXT_W_SHRINK
+    add_text(slide, x, top + _DISCUSSION_LABEL_DY, w, _DISCUSSION_LABEL_H,
              "💬 DISCUSSION PROMPT", font_size=19, color=PURPLE, bold=True)
-    add_text(slide, left + Inches(0.3), top + Inches(0.55), width - Inches(0.6), height - Inches(0.7),
+    add_text(slide, x, top + _DISCUSSION_TEXT_DY, w, height - _DISCUSSION_TEXT_H_SHRINK,
              question, font_size=28, color=WHITE)
 
+# Fixed (left, top, width, height) boxes for title_slide and content_slide.
+# Index 0 is the layout without a module label / emoji, index 1 with one.
+def _title_boxes(y):
+    return ((_in(1), y, _in(11.333), _in(1.0)),
+            (_in(1), y + _in(1.1), _in(11.333), _in(1.0)),
+            (IN_1_5, y + _in(1.1) + _in(1.0), IN_10_333, IN_1_5))
+
+_TITLE_LABEL_BOX = (_in(1), _in(1.0), _in(11.333), _in(0.4))
+_TITLE_BOXES = (_title_boxes(_in(1.0)), _title_boxes(_in(1.0) + _in(0.5)))
+
+_CONTENT_TOP = _in(0.4)
+_CONTENT_X = _in(0.8)
+_CONTENT_W = _in(11.733)
+# Body text, bullets and the note sit in the narrower 1.5in..11.833in column.
+_CONTENT_COLUMN_INDENT = _in(0.7)
+_CONTENT_GAP = _pt(8)
+_CONTENT_EMOJI_DY = _in(0.8)
+_CONTENT_TITLE_DY = _in(0.7)
+_CONTENT_BODY_H = _in(0.8)
+_CONTENT_CALLOUT_H = _in(1.0)
+_CONTENT_CALLOUT_DY = _in(1.1)
+_CONTENT_NOTE_H = _in(0.5)
+# callout type -> (label color, border color)
+_CALLOUT_COLORS = {
+    'rt': (PINK, PURPLE),
+    'warn': (WARN, WARN),
+    'tip': (GREEN, GREEN),
+    'green': (GREEN, GREEN),
+}
+
 def title_slide(emoji, title, subtitle, module_label=None):
     slide = add_slide()
-    y = Inches(1.0)
     if module_label:
-        add_text(slide, Inches(1), y, Inches(11.333), Inches(0.4),
+        add_text(slide, *_TITLE_LABEL_BOX,
                  module_label.upper(), font_size=14, color=TEAL, bold=True, alignment=PP_ALIGN.CENTER)
-        y += Inches(0.5)
-    add_text(slide, Inches(1), y, Inches(11.333), Inches(1.0),
+    emoji_box, title_box, subtitle_box = _TITLE_BOXES[bool(module_label)]
+    add_text(slide, *emoji_box,
              emoji, font_size=72, alignment=PP_ALIGN.CENTER)
-    y += Inches(1.1)
-    add_text(slide, Inches(1), y, Inches(11.333), Inches(1.0),
+    add_text(slide, *title_box,
              title, font_size=48, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-    y += Inches(1.0)
-    add_text(slide, Inches(1.5), y, Inches(10.333), Inches(1.5),
+    add_text(slide, *subtitle_box,
              subtitle, font_size=26, color=DIM, alignment=PP_ALIGN.CENTER)
     return slide
 
 def content_slide(emoji, title, body_items=None, body_text=None, callouts=None, note=None):
     slide = add_slide()
-    y = Inches(0.4)
+    # Emoji, title, body text and bullets share one text box, rendered from
+    # the paragraph templates and parsed in one go. The callouts need their
+    # own shapes, so they start where the bullets are expected to end; the
+    # note joins the text box unless callouts sit in between.
+    y = _CONTENT_TOP
+    if emoji:
+        y += _CONTENT_EMOJI_DY
+    y += _CONTENT_TITLE_DY
+    if body_text:
+        y += _CONTENT_BODY_H
+    if body_items:
+        y += _in(len(body_items) * 0.38)
+    inline_note = note and not callouts
+    height = y - _CONTENT_TOP + (_CONTENT_NOTE_H if inline_note else 0)
+    paragraphs = []
     if emoji:
-        add_text(slide, Inches(1), y, Inches(11.333), Inches(0.8),
-                 emoji, font_size=52, alignment=PP_ALIGN.CENTER)
-        y += Inches(0.8)
-    add_text(slide, Inches(0.8), y, Inches(11.733), Inches(0.6),
-             title, font_size=36, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-    y += Inches(0.7)
+        paragraphs.append(paragraph_xml(emoji, font_size=52, alignment=PP_ALIGN.CENTER))
+    paragraphs.append(paragraph_xml(title, font_size=36, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER))
     if body_text:
-        add_text(slide, Inches(1.5), y, Inches(10.333), Inches(0.8),
-                 body_text, font_size=28, color=DIM, alignment=PP_ALIGN.CENTER)
-        y += Inches(0.8)
+        paragraphs.append(paragraph_xml(body_text, font_size=28, color=DIM, alignment=PP_ALIGN.CENTER,
+                                        indent=_CONTENT_COLUMN_INDENT, space_before=_CONTENT_GAP))
     if body_items:
-        add_bullets(slide, Inches(1.5), y, Inches(10.333), Inches(4.5), body_items)
-        y += Inches(len(body_items) * 0.38)
+        paragraphs.append(bullets_xml(body_items, indent=_CONTENT_COLUMN_INDENT))
+    if inline_note:
+        paragraphs.append(paragraph_xml(note, font_size=18, color=PURPLE, alignment=PP_ALIGN.CENTER,
+                                        indent=_CONTENT_COLUMN_INDENT, space_before=_CONTENT_GAP))
+    add_text_frame(slide, _CONTENT_X, _CONTENT_TOP, _CONTENT_W, height, ''.join(paragraphs))
     if callouts:
         for ctype, label, text in callouts:
-            lc = PINK if ctype == 'rt' else (WARN if ctype == 'warn' else GREEN)
-            bc = PURPLE if ctype == 'rt' else (WARN if ctype == 'warn' else GREEN)
-            add_callout(slide, Inches(1.5), y, Inches(10.333), Inches(1.0), label, text, lc, bc)
-            y += Inches(1.1)
-    if note:
-        add_text(slide, Inches(1.5), y, Inches(10.333), Inches(0.5),
-                 note, font_size=18, color=PURPLE, alignment=PP_ALIGN.CENTER)
+            lc, bc = _CALLOUT_COLORS[ctype]
+            add_callout(slide, IN_1_5, y, IN_10_333, _CONTENT_CALLOUT_H, label, text, lc, bc)
+            y += _CONTENT_CALLOUT_DY
+        if note:
+            add_text(slide, IN_1_5, y, IN_10_333, _CONTENT_NOTE_H,
+                     note, font_size=18, color=PURPLE, alignment=PP_ALIGN.CENTER)
     return slide
 
 def discussion_slide(question):
     slide = add_slide()
-    add_discussion(slide, Inches(1.5), Inches(1.5), Inches(10.333), Inches(4.5), question)
+    add_discussion(slide, IN_1_5, IN_1_5, IN_10_333, _in(4.5), question)
     return slide
 
+# Every quiz slide repeats the same four paragraph styles: the header, the
+# questions, and the other and correct options (indexed by is-correct).
+_QUIZ_TITLE_P = paragraph_head_xml(34, PURPLE, True, PP_ALIGN.CENTER)
+_QUIZ_QUESTION_P = paragraph_head_xml(26, WHITE, True)
+# Options go in table cells, where the table style's text color and font
+# would win over paragraph defaults, so they carry their formatting on the run.
+_QUIZ_OPTION_P = tuple(
+    '<a:p><a:r><a:rPr sz="%d"><a:solidFill><a:srgbClr val="%s"/></a:solidFill>'
+    '<a:latin typeface="%s"/></a:rPr><a:t>%s' % (_pt(16).centipoints, color, FONT, marker)
+    for color, marker in ((DIM, '○ '), (GREEN, '✅ ')))
+
 def quiz_slide(questions, slide_title="📝 Quiz"):
     """questions = list of (question, options, correct_idx, explanation)"""
     slide = add_slide()
-    add_text(slide, Inches(0.8), Inches(0.3), Inches(11.733), Inches(0.6),
-             slide_title, font_size=34, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-    y = Inches(1.0)
+    add_text_frame(slide, _in(0.8), _in(0.3), _in(11.733), _in(0.6),
+                   '%s%s</a:p>' % (_QUIZ_TITLE_P, runs_xml(slide_title)))
+    y = _in(1.0)
     for q, opts, ci, expl in questions:
-        add_text(slide, Inches(1.2), y, Inches(10.9), Inches(0.5),
-                 q, font_size=26, color=WHITE, bold=True)
-        y += Inches(0.45)
-        for i, o in enumerate(opts):
-            marker = "✅ " if i == ci else "○ "
-            c = GREEN if i == ci else DIM
-            add_text(slide, Inches(1.6), y, Inches(10.5), Inches(0.3),
-                     marker + o, font_size=16, color=c)
-            y += Inches(0.28)
+        add_text_frame(slide, _in(1.2), y, _in(10.9), _in(0.5),
+                       '%s%s</a:p>' % (_QUIZ_QUESTION_P, runs_xml(q)))
+        y += _in(0.45)
+        # All options in one table; shifted down by a text box's top inset
+        # so each line sits where its own text box used to put it.
+        add_table_rows(slide, _in(1.6), y + EMU_005, _in(10.5), _in(0.28), [
+            '%s%s</a:t></a:r></a:p>' % (_QUIZ_OPTION_P[i == ci], escape(o))
+            for i, o in enumerate(opts)])
+        y += _in(0.28) * len(opts)
         # Speaker notes for explanation
-        y += Inches(0.15)
-    # Add explanations to speaker notes
-    notes_slide = slide.notes_slide
-    notes_tf = notes_slide.notes_text_frame
-    for q, opts, ci, expl in questions:
-        p = notes_tf.add_paragraph()
-        p.text = f"Q: {q}\nA: {expl}\n"
+        y += _in(0.15)
+    # Add explanations to speaker notes, all paragraphs parsed in one go.
+    # Only touch slide.notes_slide when there is something to put there,
+    # since reading it creates the notes part.
+    if any(expl for q, opts, ci, expl in questions):
+        paragraphs = ''.join('<a:p>%s</a:p>' % runs_xml(f"Q: {q}\nA: {expl}\n")
+                             for q, opts, ci, expl in questions)
+        notes_txBody = slide.notes_slide.notes_text_frame._txBody
+        notes_txBody.extend(list(parse_xml('<p:txBody %s>%s</p:txBody>' % (nsdecls('p', 'a'), paragraphs))))
     return slide
 
 # ═══════════════════════════════════════════
@@ -226,16 +459,16 @@ content_slide("💪", "We Trust You, Elli",
     body_text="The fact that you're getting a phone means your parents believe you're ready for more responsibility.\n\nThis course is about giving you the knowledge and tools to handle it like a boss.")
 
 # 4 - What a Phone Really Means
-content_slide("⚖️", "What a Phone Really Means", [
+content_slide("⚖️", "What a Phone Really Means", (
     ("🌍", "Access to the entire world — the good AND the bad"),
     ("🗣️", "A direct line to anyone, anywhere, anytime"),
     ("📸", "A camera that can capture (and share) anything"),
     ("🧠", "A tool that can make your life better — or worse"),
     ("💡", "It all depends on how YOU use it"),
-])
+))
 
 # 5 - What You'll Learn
-content_slide("🎯", "What You'll Learn Today", [
+content_slide("🎯", "What You'll Learn Today", (
     ("🔧", "Building healthy tech habits"),
     ("🛡️", "Spotting scams and staying safe from predators"),
     ("🔒", "Protecting your personal information"),
@@ -244,7 +477,7 @@ content_slide("🎯", "What You'll Learn Today", [
     ("📊", "Outsmarting the algorithm"),
     ("📱", "Social media — the real talk"),
     ("🌟", "Using your phone to level up your life"),
-])
+))
 
 # 6 - Discussion
 discussion_slide("Before we start: Elli, what are you MOST excited about having your own phone? What (if anything) makes you nervous about it?")
@@ -259,52 +492,52 @@ content_slide("📊", "Screen Time Awareness",
     body_text="The average teen spends 7+ hours per day on screens (outside of school).\n\nThat's almost a full-time job! Being aware of your usage is the first step to staying in control.")
 
 # Set Boundaries
-content_slide("⏱️", "Set Your Own Boundaries", [
+content_slide("⏱️", "Set Your Own Boundaries", (
     ("📱", "Use Screen Time / Digital Wellbeing to track your usage"),
     ("⏰", "Set daily app limits (especially TikTok and YouTube — they're time machines!)"),
     ("🎯", 'Ask yourself: "Am I using my phone on purpose, or just because I\'m bored?"'),
     ("📝", "Try a \"screen time journal\" for the first week — you'll be surprised!"),
-])
+))
 
 # Notifications
 content_slide("🔔", "Tame Your Notifications",
     body_text="Every buzz, ding, and banner is designed to pull you back in.",
-    body_items=[
+    body_items=(
         ("🔇", "Turn off notifications for most apps"),
         ("⭐", "Only keep notifications for calls, texts from family, and essentials"),
         ("🧘", 'Try "Do Not Disturb" mode during homework and meals'),
         ("💡", "YOU decide when to check your phone — not the app"),
-    ])
+    ))
 
 # Sleep
 content_slide("😴", "Sleep Hygiene",
     body_text="Blue light and late-night scrolling wreck your sleep — and sleep is everything at your age.",
-    body_items=[
+    body_items=(
         ("🚫", "No phone in your bedroom at night"),
         ("🔌", "Phone charges in the kitchen/living room overnight"),
         ("⏰", "Screen curfew: 1 hour before bed"),
         ("😌", "Your brain needs downtime to process the day"),
-    ],
-    callouts=[("rt", "Real Talk", "Studies show teens who keep phones in their bedroom get 30 minutes LESS sleep per night on average. Over a year, that's 180 hours of lost sleep.")])
+    ),
+    callouts=(("rt", "Real Talk", "Studies show teens who keep phones in their bedroom get 30 minutes LESS sleep per night on average. Over a year, that's 180 hours of lost sleep."),))
 
 # Phone Stack
 content_slide("🃏", "The Phone Stack Game",
     body_text="When hanging out with friends or family:",
-    body_items=[
+    body_items=(
         ("📱", "Everyone stacks their phones in the middle of the table"),
         ("🚫", "First person to grab their phone loses (pays for dessert, does a dare, etc.)"),
         ("🤝", "It's about being PRESENT with the people in front of you"),
-    ],
+    ),
     note="The people in front of you always matter more than the people on your screen.")
 
 # Phone-Free Zones
-content_slide("📵", "Phone-Free Zones & Times", [
+content_slide("📵", "Phone-Free Zones & Times", (
     ("🍽️", "Meals — always phone-free"),
     ("📚", "Homework time — phone in another room"),
     ("🛏️", "Bedroom at night"),
     ("⛪", "Family events, ceremonies, gatherings"),
     ("🚗", "Car rides (try talking instead!)"),
-], callouts=[("tip", "Pro Tip", "Making these habits now means they'll feel natural forever. It's way harder to break bad habits than to build good ones from the start.")])
+), callouts=(("tip", "Pro Tip", "Making these habits now means they'll feel natural forever. It's way harder to break bad habits than to build good ones from the start."),))
 
 # Discussion
 discussion_slide("Elli, what phone-free zones and times make sense for your family? Discuss and agree on at least 3 together.")
@@ -317,27 +550,27 @@ title_slide("🛡️", "Watching Out for Scams & Predators",
 # Scams
 content_slide("🎣", "How Scams Work",
     body_text="Scammers use psychological tricks to get you to act without thinking:",
-    body_items=[
+    body_items=(
         ("⏰", 'Urgency — "Act NOW or lose your account!"'),
         ("🎁", 'Too good to be true — "You won a free iPhone!"'),
         ("😨", 'Fear — "Your account has been hacked!"'),
         ("❤️", 'Emotion — "Help this sick puppy!"'),
         ("🎭", "Impersonation — pretending to be a friend, company, or authority"),
-    ])
+    ))
 
 # Scams Targeting Teens
 s = add_slide()
-add_text(s, Inches(0.8), Inches(0.3), Inches(11.733), Inches(0.6),
+add_text(s, _in(0.8), _in(0.3), _in(11.733), _in(0.6),
          "🎯 Scams Targeting Teens", font_size=36, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-add_callout(s, Inches(1.2), Inches(1.1), Inches(10.9), Inches(1.3),
+add_callout(s, _in(1.2), _in(1.1), _in(10.9), _in(1.3),
     "Fake Giveaway",
     'You see a TikTok post: "🎉 FREE iPhone! Just follow, like, share, and enter your email + address!" — This is ALWAYS a scam.',
     WARN, WARN)
-add_callout(s, Inches(1.2), Inches(2.6), Inches(10.9), Inches(1.3),
+add_callout(s, _in(1.2), _in(2.6), _in(10.9), _in(1.3),
     "Phishing Text",
     '"Your Snapchat account will be deleted in 24 hours. Click here to verify." — Fake link. Real Snapchat would never text you this.',
     WARN, WARN)
-add_callout(s, Inches(1.2), Inches(4.1), Inches(10.9), Inches(1.3),
+add_callout(s, _in(1.2), _in(4.1), _in(10.9), _in(1.3),
     "Cash App Flip",
     '"Send me $50 and I\'ll flip it to $500 with this money hack!" — Nobody can magically multiply money. This is theft.',
     WARN, WARN)
@@ -349,17 +582,17 @@ content_slide("⚠️", "Online Predators",
 # Grooming
 content_slide("🎭", "How Grooming Works",
     body_text="Grooming is a step-by-step process:",
-    body_items=[
+    body_items=(
         ("1️⃣", "Targeting — They find someone who seems lonely, insecure, or seeking attention"),
         ("2️⃣", 'Building trust — "You\'re so mature for your age" / "I totally get you"'),
         ("3️⃣", "Filling a need — Compliments, gifts, attention, \"understanding\""),
         ("4️⃣", 'Isolating — "Don\'t tell your parents, they wouldn\'t understand"'),
         ("5️⃣", "Desensitizing — Gradually introducing inappropriate topics"),
         ("6️⃣", "Exploiting — Asking for photos, meetups, or favors"),
-    ])
+    ))
 
 # Red Flags
-content_slide("🚩", "Red Flags in Online Conversations", [
+content_slide("🚩", "Red Flags in Online Conversations", (
     ("🚩", "They ask you to keep the friendship a secret"),
     ("🚩", 'They say "you\'re so mature for your age"'),
     ("🚩", "They ask personal questions quickly (where you live, what school)"),
@@ -368,10 +601,10 @@ content_slide("🚩", "Red Flags in Online Conversations", [
     ("🚩", "They ask for photos (especially selfies)"),
     ("🚩", "They get upset or guilt-trip you if you say no"),
     ("🚩", 'They claim to be a teen but something feels "off"'),
-])
+))
 
 # Never Share
-content_slide("🔐", "NEVER Share These Online", [
+content_slide("🔐", "NEVER Share These Online", (
     ("🏠", "Home address"),
     ("🏫", "School name"),
     ("📍", "Current location"),
@@ -380,32 +613,32 @@ content_slide("🔐", "NEVER Share These Online", [
     ("👤", "Full name"),
     ("🎂", "Birthday"),
     ("🔑", "Passwords"),
-], note="Not with strangers. Not with online friends. Not in games. Not ever.")
+), note="Not with strangers. Not with online friends. Not in games. Not ever.")
 
 # If Something Feels Wrong
 s = add_slide()
-add_text(s, Inches(0.8), Inches(0.5), Inches(11.733), Inches(0.8),
+add_text(s, _in(0.8), _in(0.5), _in(11.733), _in(0.8),
          "🆘 If Something Feels Wrong...", font_size=36, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-shape = s.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1.5), Inches(1.5), Inches(10.333), Inches(4.5))
+shape = s.shapes.add_shape(_ROUNDED_RECT, _in(1.5), _in(1.5), _in(10.333), _in(4.5))
 shape.fill.solid()
-shape.fill.fore_color.rgb = RGBColor(0x15, 0x2a, 0x1f)
+shape.fill.fore_color.rgb = SAFE_BOX_BG
 shape.line.color.rgb = GREEN
-shape.line.width = Pt(3)
-add_text(s, Inches(2), Inches(1.7), Inches(9.333), Inches(0.4),
+shape.line.width = _pt(3)
+add_text(s, _in(2), _in(1.7), _in(9.333), _in(0.4),
          "THE #1 RULE", font_size=14, color=GREEN, bold=True)
-add_text(s, Inches(2), Inches(2.2), Inches(9.333), Inches(0.6),
+add_text(s, _in(2), _in(2.2), _in(9.333), _in(0.6),
          "Tell a parent IMMEDIATELY.", font_size=38, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-add_text(s, Inches(2), Inches(3.0), Inches(9.333), Inches(2.5),
+add_text(s, _in(2), _in(3.0), _in(9.333), _in(2.5),
          "You will NOT be in trouble. Not now, not ever.\nEven if you think you did something wrong.\nEven if someone told you not to tell.\nEven if you're embarrassed.\n\nElli, Mom and Dad are ALWAYS on your team. 💚",
          font_size=26, color=DIM, alignment=PP_ALIGN.CENTER)
 
 # Real Talk Scenario
 s = add_slide()
-add_callout(s, Inches(1.2), Inches(1.0), Inches(10.9), Inches(2.5),
+add_callout(s, _in(1.2), _in(1.0), _in(10.9), _in(2.5),
     "Real Talk Scenario",
     "You're playing an online game and someone who says they're 14 starts chatting with you. They're really nice and funny. After a week, they ask what school you go to and if you want to video call — but ask you not to tell your parents because \"they might not let us be friends.\"",
     PINK, PURPLE)
-add_text(s, Inches(1.5), Inches(4.0), Inches(10.333), Inches(1.0),
+add_text(s, _in(1.5), _in(4.0), _in(10.333), _in(1.0),
          "Every single thing about this is a red flag.\nA real friend would never ask you to hide the friendship.",
          font_size=28, color=WARN, bold=True, alignment=PP_ALIGN.CENTER)
 
@@ -413,40 +646,40 @@ add_text(s, Inches(1.5), Inches(4.0), Inches(10.333), Inches(1.0),
 content_slide("🔞", "Explicit Content Online",
     body_text="Elli, this is an awkward topic but an important one. Pornography and explicit content exist all over the internet — and it can show up even when you're not looking for it.\n\nPop-up ads, links in group chats, search results, social media — it can appear unexpectedly on almost any platform.")
 
-content_slide("🚫", "Why This Content Is Harmful", [
+content_slide("🚫", "Why This Content Is Harmful", (
     ("🧠", "It creates unrealistic and harmful expectations about relationships and bodies"),
     ("💔", "It can warp your understanding of what healthy relationships look like"),
     ("😰", "It can make you feel confused, uncomfortable, or anxious"),
     ("📱", "It's designed for adults and does NOT reflect real life — not even close"),
     ("🌱", "Your brain is still developing, and this content can genuinely affect how you see yourself and others"),
-])
+))
 
-content_slide("🛑", "If You Accidentally See Something", [
+content_slide("🛑", "If You Accidentally See Something", (
     ("❌", "Close it immediately — don't keep looking out of curiosity"),
     ("🗣️", "Tell Mom or Dad — you will NOT be in trouble, we promise"),
     ("💚", "No shame — accidentally seeing something doesn't mean you did anything wrong"),
     ("🚫", "Don't share it — sharing explicit content involving minors is actually illegal"),
     ("🔍", "Don't go looking for more — curiosity is normal, but this content is genuinely harmful"),
-], callouts=[("green", "Remember", "Seeing something explicit by accident is NOT your fault. It happens to almost everyone online. What matters is what you do next.")])
+), callouts=(("green", "Remember", "Seeing something explicit by accident is NOT your fault. It happens to almost everyone online. What matters is what you do next."),))
 
-content_slide("⚠️", "Where Explicit Content Can Appear", [
+content_slide("⚠️", "Where Explicit Content Can Appear", (
     ("💬", "Group chats and DMs (people send links or images)"),
     ("🔍", "Search engines and image searches (even innocent searches)"),
     ("📱", "Social media feeds — TikTok, YouTube, even Pinterest"),
     ("🎮", "Online games and gaming chat platforms"),
     ("📺", "Streaming sites with inadequate age filters"),
     ("💻", "Pop-up ads on free websites"),
-], note="Being aware of where it can appear helps you be prepared if it does.")
+), note="Being aware of where it can appear helps you be prepared if it does.")
 
 content_slide("🛡️", "Parental Controls Are on Your Side",
     body_text="Elli, the parental controls on your devices are there to help you, not spy on you.",
-    body_items=[
+    body_items=(
         ("🔒", "They filter out content that no kid should have to see"),
         ("💚", "They're like a seatbelt — a safety tool, not a punishment"),
         ("🤝", "As you get older and show responsibility, settings can be adjusted together"),
         ("🗣️", "If a control blocks something you need for school, just ask"),
-    ],
-    callouts=[("tip", "The Big Picture", "We're not trying to control your every move. We're trying to make sure you don't stumble into stuff that could genuinely hurt you. That's our job as parents. 💚")])
+    ),
+    callouts=(("tip", "The Big Picture", "We're not trying to control your every move. We're trying to make sure you don't stumble into stuff that could genuinely hurt you. That's our job as parents. 💚"),))
 
 discussion_slide("Elli, have you ever encountered anything online that made you uncomfortable? What would you do if an online stranger asked you to keep a secret from us? And remember — if you ever see something explicit, you can always come to us without any judgment.")
 
@@ -455,7 +688,7 @@ title_slide("🔒", "Protecting Your Personal Information",
     "Your data is valuable.\nTreat it like treasure, Elli.",
     "Module 4 — Privacy")
 
-content_slide("💎", "What Counts as Personal Info?", [
+content_slide("💎", "What Counts as Personal Info?", (
     ("👤", "Full name, birthday, age"),
     ("🏠", "Address, phone number, email"),
     ("🏫", "School name, team/club names"),
@@ -464,36 +697,36 @@ content_slide("💎", "What Counts as Personal Info?", [
     ("🔑", "Passwords, security questions"),
     ("💳", "Financial info (even your parents')"),
     ("🧬", "Health info, family details"),
-], note="If it can be used to find you, identify you, or impersonate you — protect it.")
+), note="If it can be used to find you, identify you, or impersonate you — protect it.")
 
-content_slide("⚙️", "Privacy Settings Matter", [
+content_slide("⚙️", "Privacy Settings Matter", (
     ("🔒", "Set ALL social media accounts to private"),
     ("📍", "Turn off location sharing in apps (except with family)"),
     ("📷", "Disable camera/microphone access for apps that don't need it"),
     ("🔍", "Google yourself — see what's already out there"),
     ("📋", "Review app permissions regularly"),
-], callouts=[("tip", "Pro Tip", 'When installing a new app, ask: "Does this app REALLY need access to my contacts and location?" If the permissions don\'t make sense, don\'t install it.')])
+), callouts=(("tip", "Pro Tip", 'When installing a new app, ask: "Does this app REALLY need access to my contacts and location?" If the permissions don\'t make sense, don\'t install it.'),))
 
 content_slide("🏷️", '"Free" Apps Aren\'t Free',
     body_text="If you're not paying for the product...\n\nYOU are the product.\n\nFree apps like TikTok, Pinterest, and YouTube make money by collecting your data and selling it to advertisers. Every tap, scroll, search, and like is tracked and monetized.")
 
-content_slide("🔑", "Password Hygiene", [
+content_slide("🔑", "Password Hygiene", (
     ("✅", "Use long, unique passwords for every account (12+ characters)"),
     ("✅", "Mix uppercase, lowercase, numbers, and symbols"),
     ("✅", "Use a password manager (ask Mom/Dad to help set one up)"),
     ("❌", "NEVER use your name, birthday, or pet's name"),
     ("❌", "NEVER reuse passwords across sites"),
     ("❌", "NEVER share passwords with friends (even best friends)"),
-], callouts=[("tip", "Easy Password Trick", 'Think of a sentence: "My cat Luna loves 3 treats at bedtime!" → McLl3t@b! — long, random, and easy for YOU to remember.')])
+), callouts=(("tip", "Easy Password Trick", 'Think of a sentence: "My cat Luna loves 3 treats at bedtime!" → McLl3t@b! — long, random, and easy for YOU to remember.'),))
 
 content_slide("👣", "Your Digital Footprint",
     body_text="Everything you post, like, comment, search for, or share online creates a permanent trail.",
-    body_items=[
+    body_items=(
         ("🏫", "College admissions officers check social media"),
         ("💼", "Future employers will Google you"),
         ("📸", "Screenshots mean deleted posts aren't really deleted"),
         ("⏰", "Something you post at 13 can follow you at 30"),
-    ],
+    ),
     note="The internet never forgets, Elli.")
 
 discussion_slide("What's one thing you didn't realize counted as 'personal information' before today? How will you decide which apps to give permissions to?")
@@ -505,26 +738,26 @@ title_slide("🧠", "Protecting Your Mental Health",
 
 content_slide("🪞", "The Comparison Trap",
     body_text="What you see on social media is a highlight reel, not real life.",
-    body_items=[
+    body_items=(
         ("📸", "People post their best moments, not their bad days"),
         ("✨", "Filters, editing, and staging make everything look perfect"),
         ("🎭", "Even influencers have acne, bad hair days, and insecurities"),
         ("💔", "Comparing your behind-the-scenes to someone else's highlight reel is unfair to YOU"),
-    ])
+    ))
 
 content_slide("📌", "A Note About Pinterest",
     body_text="Pinterest is generally a great app for inspiration and creativity, Elli. But there's a flip side:",
-    body_items=[
+    body_items=(
         ("🪞", 'Boards full of "perfect" bodies, rooms, outfits can create unrealistic standards'),
         ("📊", "The more you save certain types of content, the more it shows you — this can spiral"),
         ("💚", "Curate intentionally — fill your boards with things that inspire YOU"),
         ("🎨", "Use it for creative projects, book ideas, art inspiration — that's where Pinterest shines!"),
-    ],
-    callouts=[("tip", "Healthy Pinterest Habit", "If you notice you're feeling bad about yourself after scrolling Pinterest, that's a sign to curate your boards differently. Pin content that sparks JOY and creativity.")])
+    ),
+    callouts=(("tip", "Healthy Pinterest Habit", "If you notice you're feeling bad about yourself after scrolling Pinterest, that's a sign to curate your boards differently. Pin content that sparks JOY and creativity."),))
 
 content_slide("🪞", "AI Face Filters — The Fun Lie",
     body_text="Filters that change your face are everywhere. Fun — but they can mess with how you see yourself.",
-    body_items=[
+    body_items=(
         ("📸", "TikTok, Snapchat, and Instagram filters change how you look in real-time"),
         ("🧠", 'Using them constantly can make your REAL face feel "wrong" — called "Snapchat dysmorphia"'),
         ("🪞", "You start comparing yourself to a filtered version of YOU that doesn't exist"),
@@ -532,40 +765,40 @@ content_slide("🪞", "AI Face Filters — The Fun Lie",
         ("😄", "Silly/fun filters (dog ears, rainbow vomit)? Go for it!"),
         ("⚠️", "Filters that change your actual features? Be careful how often you use them"),
         ("❤️", "If you feel \"worse\" without a filter — that's the filter's damage, not your face"),
-    ],
+    ),
     note='"Your real face is the one people love, Elli."')
 
 content_slide("😰", "FOMO — Fear of Missing Out",
     body_text="That sinking feeling when everyone seems to be having fun without you.",
-    body_items=[
+    body_items=(
         ("📱", "Seeing friends hang out without you on Snapchat or TikTok"),
         ("🎉", "Feeling like everyone's life is more exciting"),
         ("😔", "Checking your phone constantly for updates"),
-    ],
-    callouts=[("green", "The Truth", "FOMO is manufactured by social media. People only post when things look fun. JOMO (Joy of Missing Out) is a real thing — being happy with what YOU'RE doing right now.")])
+    ),
+    callouts=(("green", "The Truth", "FOMO is manufactured by social media. People only post when things look fun. JOMO (Joy of Missing Out) is a real thing — being happy with what YOU'RE doing right now."),))
 
 content_slide("😢", "Cyberbullying",
     body_text="Bullying that happens through phones and online:",
-    body_items=[
+    body_items=(
         ("💬", "Mean messages, comments, or DMs"),
         ("📸", "Sharing embarrassing photos without permission"),
         ("🚫", "Deliberately excluding someone in group chats"),
         ("👤", "Creating fake accounts to harass someone"),
         ("📢", "Spreading rumors online"),
         ("🔄", "Screenshotting private conversations to embarrass someone"),
-    ])
+    ))
 
-content_slide("🛡️", "If You're Being Cyberbullied", [
+content_slide("🛡️", "If You're Being Cyberbullied", (
     ("📸", "Screenshot everything (evidence matters)"),
     ("🚫", "Don't respond (they want a reaction)"),
     ("🔒", "Block the person"),
     ("🗣️", "Tell a parent or trusted adult"),
     ("📝", "Report it on the platform"),
-], callouts=[("green", "If You See It Happening to Someone Else...", "Don't be a bystander. Don't join in or share it. Stand up for them, or tell an adult. Being kind online takes courage — and it matters more than you know.")])
+), callouts=(("green", "If You See It Happening to Someone Else...", "Don't be a bystander. Don't join in or share it. Stand up for them, or tell an adult. Being kind online takes courage — and it matters more than you know."),))
 
 content_slide("👥", "Group Chat Pressure",
     body_text="Group chats can be fun — but they can also get weird fast.",
-    body_items=[
+    body_items=(
         ("🤐", "Pressure to agree with the group or pile on someone"),
         ("📸", "Someone shares something inappropriate — now everyone's seen it"),
         ("🚪", "Being added to chats without permission"),
@@ -575,32 +808,32 @@ content_slide("👥", "Group Chat Pressure",
         ("🤫", "You don't have to respond to everything"),
         ("📸", "If something crosses a line, screenshot and tell a parent"),
         ("🔇", "Mute chats that stress you out"),
-    ])
+    ))
 
 content_slide("🔄", "The Dopamine Loop",
     body_text="Here's why you can't stop scrolling:",
-    body_items=[
+    body_items=(
         ("🧪", 'Every like, comment, and new post gives your brain a tiny hit of dopamine (the "feel good" chemical)'),
         ("🎰", "Apps are designed like slot machines — you keep scrolling hoping for the next reward"),
         ("📱", "This is NOT an accident. Billions of dollars are spent making apps as addictive as possible"),
         ("🧠", "Knowing this gives you power over it"),
-    ])
+    ))
 
-content_slide("📉", "Real Stats on Teens & Phones", [
+content_slide("📉", "Real Stats on Teens & Phones", (
     ("📊", "Teens who spend 5+ hrs/day on social media are 3x more likely to report depression"),
     ("😴", "70% of teens say social media makes them feel worse about their appearance"),
     ("📱", "1 in 3 teens say they wish they could go back to life before social media"),
     ("💚", "BUT — teens who use phones for connection and creativity report higher well-being"),
-], note="It's not about having a phone. It's about HOW you use it.")
+), note="It's not about having a phone. It's about HOW you use it.")
 
-content_slide("🚦", "Signs You Need a Phone Break", [
+content_slide("🚦", "Signs You Need a Phone Break", (
     ("😤", "You feel anxious or upset after scrolling"),
     ("🔄", "You pick up your phone without thinking"),
     ("😴", "You're staying up late because of your phone"),
     ("😔", "You feel worse about yourself after social media"),
     ("🤯", "You can't focus on homework or conversations"),
     ("📱", "You feel panicky without your phone nearby"),
-], note="Any of these? Time to take a break. Go outside, read a book, work on your writing, talk to someone IRL. 🌿")
+), note="Any of these? Time to take a break. Go outside, read a book, work on your writing, talk to someone IRL. 🌿")
 
 discussion_slide("Elli, how do you feel after spending a long time on social media or TikTok? What could you do instead of scrolling when you're bored? Let's brainstorm 5 phone-free activities you enjoy.")
 
@@ -609,83 +842,83 @@ title_slide("🤖", "Navigating AI",
     "AI is powerful. Learn to use it wisely,\nnot blindly.",
     "Module 6 — AI")
 
-content_slide("🤖", "What AI Is (and Isn't)", [
+content_slide("🤖", "What AI Is (and Isn't)", (
     ("✅", "AI = software that can generate text, images, code, music, and more"),
     ("✅", "Examples: ChatGPT, Siri, Google Gemini, image generators, AI filters"),
     ("❌", 'AI is NOT actually "thinking" — it\'s predicting patterns'),
     ("❌", "AI is NOT always right — it can sound confident while being completely wrong"),
     ("💡", "AI is a tool, like a calculator. Great when used correctly, dangerous when trusted blindly."),
-])
+))
 
 content_slide("⚠️", "AI Gets Things Wrong",
     body_text='AI "hallucinations" are when AI confidently makes up information.',
-    body_items=[
+    body_items=(
         ("🔍", "ALWAYS verify AI-generated information"),
         ("📚", "Use AI as a starting point, not the final answer"),
         ("🧠", "Your critical thinking is more valuable than any AI output"),
-    ],
-    callouts=[("warn", "Example", "Ask ChatGPT for sources for a school paper and it might invent fake books by real authors with convincing titles. If you turn that in — that's on YOU.")])
+    ),
+    callouts=(("warn", "Example", "Ask ChatGPT for sources for a school paper and it might invent fake books by real authors with convincing titles. If you turn that in — that's on YOU."),))
 
 content_slide("📝", "ChatGPT & Your Book",
     body_text="Elli, you use ChatGPT to help with your writing, and that's awesome!",
-    body_items=[
+    body_items=(
         ("✅", "Using it to brainstorm ideas, work through plot problems — great!"),
         ("✅", "Using it to check grammar or get feedback — great!"),
         ("⚠️", "Don't let it write whole chapters FOR you — your voice is what makes your book special"),
         ("🔍", "Always fact-check anything it tells you"),
         ("🚫", "Never share personal details with ChatGPT"),
         ("💡", "Anything you type into ChatGPT may be stored and used for training"),
-    ],
-    callouts=[("tip", "Remember", "ChatGPT is a tool, not a replacement for YOUR creativity. The best parts of your book will always be the ideas and words that come from YOU. ✨")])
+    ),
+    callouts=(("tip", "Remember", "ChatGPT is a tool, not a replacement for YOUR creativity. The best parts of your book will always be the ideas and words that come from YOU. ✨"),))
 
 content_slide("🎭", "Deepfakes & AI Images",
     body_text="AI can now create fake photos, videos, and voices that look completely real.",
-    body_items=[
+    body_items=(
         ("📸", "Fake photos of real people (including teens)"),
         ("🗣️", "Cloned voices that sound exactly like someone you know"),
         ("📹", "Fake videos of celebrities saying things they never said"),
         ("🚫", "NEVER create or share AI-generated images of real people without consent"),
-    ],
-    callouts=[("warn", "Important", "If someone uses AI to create inappropriate images of you or someone you know — that is a CRIME. Tell a parent immediately.")])
+    ),
+    callouts=(("warn", "Important", "If someone uses AI to create inappropriate images of you or someone you know — that is a CRIME. Tell a parent immediately."),))
 
-content_slide("🎓", "AI & School", [
+content_slide("🎓", "AI & School", (
     ("✅", "Using AI to explain a concept you don't understand — great!"),
     ("✅", "Using AI to brainstorm ideas — great!"),
     ("✅", "Using AI to check your work — great!"),
     ("❌", "Copying AI-generated text as your own work — that's plagiarism"),
     ("❌", "Having AI do your homework — you're only cheating yourself"),
     ("💡", "Your teachers can often tell. And even if they can't — YOU know."),
-], callouts=[("tip", "Rule of Thumb", "Use AI like a tutor, not a ghostwriter. If you can't explain it in your own words, you didn't learn it.")])
+), callouts=(("tip", "Rule of Thumb", "Use AI like a tutor, not a ghostwriter. If you can't explain it in your own words, you didn't learn it."),))
 
 # Character.ai
 content_slide("⚠️", "Character.ai & AI Chatbot Apps",
     body_text="Apps like Character.ai let you create and chat with AI \"characters.\" These sound fun, but they can be genuinely dangerous:",
-    body_items=[
+    body_items=(
         ("🎭", "Characters can discuss adult and inappropriate topics — safety filters are weak"),
         ("🧠", "Long conversations can feel like real relationships — but they're NOT real"),
         ("💬", "These apps can normalize unhealthy conversations"),
         ("😔", "They can encourage emotional dependency on fictional characters"),
         ("🚫", "There is no real moderation"),
-    ])
+    ))
 
-s = content_slide("👏", "You Already Made the Right Call",
+content_slide("👏", "You Already Made the Right Call",
     body_text="Elli, you tried Character.ai and you deleted it. That was absolutely the right decision, and we're proud of you.")
-# Note: callouts and extra items handled inline above; adding the warning apps list
-content_slide("🚩", "AI Chatbot Apps to Avoid", [
+
+content_slide("🚩", "AI Chatbot Apps to Avoid", (
     ("🚩", "Character.ai — AI character roleplay"),
     ("🚩", "Chai — AI chat companions"),
     ("🚩", "Replika — AI \"friend\" / companion"),
     ("🚩", "Janitor AI — unfiltered AI characters"),
     ("🚩", "CrushOn.ai — explicitly designed for inappropriate AI chat"),
-], note="If an app lets you have uncensored conversations with AI characters — that's a red flag. 🚩")
+), note="If an app lets you have uncensored conversations with AI characters — that's a red flag. 🚩")
 
-content_slide("🔐", "AI & Your Privacy", [
+content_slide("🔐", "AI & Your Privacy", (
     ("🚫", "Don't share personal info with AI chatbots (name, address, school)"),
     ("🚫", "Don't upload personal photos to AI tools"),
     ("🚫", "Don't share passwords or family info"),
     ("💡", "Anything you type into an AI may be stored and used for training"),
     ("💡", "Treat AI conversations like posting on a public billboard"),
-])
+))
 
 discussion_slide("Elli, what did you notice about Character.ai that made you uncomfortable? How can you tell if an AI app is safe to use vs. one you should avoid? What makes ChatGPT different from Character.ai?")
 
@@ -696,81 +929,81 @@ title_slide("📊", "Outsmarting the Algorithm",
 
 content_slide("🧮", "How Algorithms Work",
     body_text="Every app tracks what you do and shows you more of it:",
-    body_items=[
+    body_items=(
         ("👀", "What you watch (and how long)"),
         ("❤️", "What you like, comment on, and share"),
         ("🔍", "What you search for"),
         ("⏱️", "Where you pause while scrolling"),
         ("📍", "Your location and time of day"),
-    ],
+    ),
     note="The goal? Keep you on the app as long as possible so they can show you more ads.")
 
 content_slide("🎵", "TikTok's Algorithm: The Most Powerful One",
     body_text="Elli, TikTok deserves a special callout because its algorithm is extremely powerful:",
-    body_items=[
+    body_items=(
         ("🧠", "It learns what you like within minutes — faster than any other app"),
         ("⏰", 'It\'s designed to be a massive time sink — "just 5 more minutes" becomes 2 hours'),
         ("🕳️", "Algorithm rabbit holes — it can pull you into extreme or upsetting content"),
         ("📩", "If your account isn't private, strangers can send you DMs"),
         ("⚠️", "Dangerous trends go viral and pressure teens into risky behavior"),
         ("🔒", "Keep your account PRIVATE, set time limits, and be aware"),
-    ],
-    callouts=[("rt", "Real Talk", "TikTok is fun. But it's also the app most likely to steal hours of your day without you even noticing. Set a daily time limit and stick to it.")])
+    ),
+    callouts=(("rt", "Real Talk", "TikTok is fun. But it's also the app most likely to steal hours of your day without you even noticing. Set a daily time limit and stick to it."),))
 
 content_slide("🔴", "YouTube: The Rabbit Hole Machine",
     body_text="YouTube is amazing for learning and entertainment, but watch out for:",
-    body_items=[
+    body_items=(
         ("🕳️", "Autoplay rabbit holes — one video leads to another, and suddenly it's 2 AM"),
         ("💬", "Comments section — can be toxic, hateful, or full of misinformation"),
         ("🔞", "Age-restricted content — exists for a reason; don't bypass age gates"),
         ("📊", "The algorithm wants you to keep watching — it'll recommend increasingly extreme content"),
         ("✅", "Use it intentionally — search for what you want to learn"),
-    ],
-    callouts=[("tip", "Pro Tip", "Turn OFF autoplay. Search for specific things. Use YouTube to learn and be inspired, not as a mindless scroll machine.")])
+    ),
+    callouts=(("tip", "Pro Tip", "Turn OFF autoplay. Search for specific things. Use YouTube to learn and be inspired, not as a mindless scroll machine."),))
 
 content_slide("🫧", "Filter Bubbles",
     body_text="When algorithms only show you things you agree with, you end up in a bubble.",
-    body_items=[
+    body_items=(
         ("🔄", "You only see one perspective on issues"),
         ("🤝", 'You start to think "everyone" agrees with you'),
         ("😡", "Anyone who disagrees seems crazy or wrong"),
         ("🌍", "The real world is much more diverse than your feed"),
-    ],
+    ),
     note="Deliberately follow people with different viewpoints. It makes you smarter.")
 
-content_slide("🔍", "Spotting Misinformation", [
+content_slide("🔍", "Spotting Misinformation", (
     ("🤔", "Check the source — who published this? Are they credible?"),
     ("📅", "Check the date — is this old news being recycled?"),
     ("🔎", "Read beyond the headline — articles often don't match clickbait titles"),
     ("📰", "Cross-reference — do other reliable sources report the same thing?"),
     ("😡", "Check your emotions — if it makes you furious, that might be the point"),
     ("🤷", "When in doubt, don't share — spreading false info is almost as bad as creating it"),
-])
+))
 
 s = add_slide()
-add_text(s, Inches(0.8), Inches(0.3), Inches(11.733), Inches(0.6),
+add_text(s, _in(0.8), _in(0.3), _in(11.733), _in(0.6),
          "🎣 Clickbait & Rage Bait", font_size=36, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-add_callout(s, Inches(1.2), Inches(1.2), Inches(10.9), Inches(1.5),
+add_callout(s, _in(1.2), _in(1.2), _in(10.9), _in(1.5),
     "Clickbait",
     'Headlines designed to make you click: "You won\'t BELIEVE what happened next!" "This one trick doctors HATE!" — The content almost never matches the hype.',
     WARN, WARN)
-add_callout(s, Inches(1.2), Inches(3.0), Inches(10.9), Inches(1.5),
+add_callout(s, _in(1.2), _in(3.0), _in(10.9), _in(1.5),
     "Rage Bait",
     'Content designed to make you angry so you engage: controversial takes, outrage posts. The algorithm LOVES anger because angry people comment more.',
     WARN, WARN)
-add_text(s, Inches(1.5), Inches(4.8), Inches(10.333), Inches(0.5),
+add_text(s, _in(1.5), _in(4.8), _in(10.333), _in(0.5),
          "When you feel manipulated — that's because you ARE being manipulated. Scroll past.",
          font_size=26, color=PURPLE, alignment=PP_ALIGN.CENTER)
 
 content_slide("🎨", "Curate Your Feed",
     body_text="You have more control than you think:",
-    body_items=[
+    body_items=(
         ("🚫", "Unfollow/mute accounts that make you feel bad"),
         ("🔍", "Search for content that inspires, educates, or makes you laugh"),
         ("⏱️", "Engage with the good stuff — the algorithm will learn"),
         ("❌", 'Use "Not Interested" on content you don\'t want'),
         ("🌟", "Follow creators who teach you something new"),
-    ],
+    ),
     note="YOUR feed should reflect the person you want to become, Elli.")
 
 discussion_slide("Can you think of a time you saw something online that turned out to be false? How would you fact-check a wild claim you see on TikTok or YouTube?")
@@ -782,95 +1015,95 @@ title_slide("📱", "Social Media: The Real Talk",
 
 content_slide("📋", "Your Apps — The Honest Breakdown",
     body_text="Let's go through the apps you actually use, Elli:",
-    body_items=[
+    body_items=(
         ("🎵", "TikTok — Fun but the most addictive algorithm. Keep private, set time limits."),
         ("📌", "Pinterest — Great for inspiration! Watch out for comparison traps."),
         ("🔴", "YouTube — Amazing for learning. Beware autoplay rabbit holes."),
         ("🎬", "CapCut — Creative and fun! Be careful with what you share publicly."),
         ("🤖", "ChatGPT — A great writing tool! Use it wisely."),
-    ])
+    ))
 
 content_slide("🎬", "CapCut: Creative & Fun — With Caution",
     body_text="Elli, CapCut is a great creative tool! Here's how to use it safely:",
-    body_items=[
+    body_items=(
         ("✅", "Making videos for yourself and close friends — awesome!"),
         ("✅", "Learning editing skills — this is a real, valuable skill!"),
         ("⚠️", "Don't include personal info in videos — no school name, address, location clues"),
         ("⚠️", "Be careful sharing publicly — once a video is out there, you can't take it back"),
         ("🚫", "Don't show your face + location together"),
         ("💡", "Watermark your work — credit your creations"),
-    ])
+    ))
 
 content_slide("🔒", "ALWAYS Private",
     body_text="Every single social media account should be set to PRIVATE.",
-    body_items=[
+    body_items=(
         ("✅", "Only approved followers can see your posts"),
         ("✅", "Strangers can't see your photos or info"),
         ("✅", "You control who's in your audience"),
         ("❌", "Public accounts = anyone in the world can see everything"),
-    ],
+    ),
     note="This is non-negotiable, Elli. Private. Always.")
 
 # What to post / what not to post
 s = add_slide()
-add_text(s, Inches(0.8), Inches(0.3), Inches(11.733), Inches(0.6),
+add_text(s, _in(0.8), _in(0.3), _in(11.733), _in(0.6),
          "✅ What to Post / ❌ What NOT to Post", font_size=34, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
 # OK box
-shape1 = s.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1.2), Inches(1.2), Inches(5.4), Inches(4.5))
+shape1 = s.shapes.add_shape(_ROUNDED_RECT, _in(1.2), _in(1.2), _in(5.4), _in(4.5))
 shape1.fill.solid()
-shape1.fill.fore_color.rgb = RGBColor(0x15, 0x2a, 0x1f)
+shape1.fill.fore_color.rgb = SAFE_BOX_BG
 shape1.line.color.rgb = GREEN
-shape1.line.width = Pt(2)
-add_text(s, Inches(1.5), Inches(1.4), Inches(4.8), Inches(0.5),
+shape1.line.width = _pt(2)
+add_text(s, _in(1.5), _in(1.4), _in(4.8), _in(0.5),
          "✅ OK to Post", font_size=28, color=GREEN, bold=True)
-add_text(s, Inches(1.5), Inches(2.0), Inches(4.8), Inches(3.5),
+add_text(s, _in(1.5), _in(2.0), _in(4.8), _in(3.5),
          "Creative work, hobbies, CapCut edits, group photos (with permission), funny memes, achievements, positive vibes",
          font_size=26, color=DIM)
 # NEVER box
-shape2 = s.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(6.9), Inches(1.2), Inches(5.4), Inches(4.5))
+shape2 = s.shapes.add_shape(_ROUNDED_RECT, _in(6.9), _in(1.2), _in(5.4), _in(4.5))
 shape2.fill.solid()
-shape2.fill.fore_color.rgb = RGBColor(0x2e, 0x1a, 0x1a)
+shape2.fill.fore_color.rgb = WARN_BOX_BG
 shape2.line.color.rgb = WARN
-shape2.line.width = Pt(2)
-add_text(s, Inches(7.2), Inches(1.4), Inches(4.8), Inches(0.5),
+shape2.line.width = _pt(2)
+add_text(s, _in(7.2), _in(1.4), _in(4.8), _in(0.5),
          "❌ NEVER Post", font_size=28, color=WARN, bold=True)
-add_text(s, Inches(7.2), Inches(2.0), Inches(4.8), Inches(3.5),
+add_text(s, _in(7.2), _in(2.0), _in(4.8), _in(3.5),
          "Location/address, school uniform/logo, personal drama, anything you'd regret, other people's photos without asking, angry rants",
          font_size=26, color=DIM)
 
 content_slide("📸", "Screenshots Are Forever",
     body_text="Disappearing messages don't really disappear.",
-    body_items=[
+    body_items=(
         ("📱", "Anyone can screenshot before it's gone"),
         ("🔄", "Screenshots get shared, saved, and forwarded"),
         ("💬", "Private conversations can become very public very fast"),
         ("🤔", "Before you send ANYTHING: assume it could be seen by everyone"),
-    ],
-    callouts=[("rt", "Real Talk", "Every year, teens have their lives turned upside down because a \"private\" photo or message was screenshotted and shared. Once it's out there, you can't take it back. Ever.")])
+    ),
+    callouts=(("rt", "Real Talk", "Every year, teens have their lives turned upside down because a \"private\" photo or message was screenshotted and shared. Once it's out there, you can't take it back. Ever."),))
 
 # Grandma Test
 s = add_slide()
-add_text(s, Inches(0.8), Inches(0.5), Inches(11.733), Inches(0.8),
+add_text(s, _in(0.8), _in(0.5), _in(11.733), _in(0.8),
          "👵 The Grandma Test", font_size=36, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-shape = s.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2.5), Inches(1.8), Inches(8.333), Inches(3.5))
+shape = s.shapes.add_shape(_ROUNDED_RECT, _in(2.5), _in(1.8), _in(8.333), _in(3.5))
 shape.fill.solid()
 shape.fill.fore_color.rgb = BG_SURFACE
 shape.line.fill.background()
-add_text(s, Inches(3), Inches(2.0), Inches(7.333), Inches(0.6),
+add_text(s, _in(3), _in(2.0), _in(7.333), _in(0.6),
          "Before you post anything, ask:", font_size=26, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
-add_text(s, Inches(3), Inches(2.8), Inches(7.333), Inches(1.0),
+add_text(s, _in(3), _in(2.8), _in(7.333), _in(1.0),
          '"Would I be comfortable showing this to Grandma?"', font_size=36, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-add_text(s, Inches(3), Inches(4.0), Inches(7.333), Inches(1.0),
+add_text(s, _in(3), _in(4.0), _in(7.333), _in(1.0),
          "If no → don't post it.\nSimple as that. 😊", font_size=26, color=DIM, alignment=PP_ALIGN.CENTER)
 
-content_slide("⚡", "Handling Online Drama", [
+content_slide("⚡", "Handling Online Drama", (
     ("🧊", "Don't respond when you're angry — wait at least an hour"),
     ("📵", "Take it offline — real conflicts are better resolved face-to-face"),
     ("🚫", "Don't get involved in other people's drama"),
     ("📸", "Don't screenshot and share private arguments"),
     ("🗣️", "Talk to a parent if it's serious"),
     ("💡", "Remember: What you say online has real consequences for real people"),
-])
+))
 
 discussion_slide("Elli, let's review your social media accounts together. Are they all set to private? What kind of content do you want to be known for posting?")
 
@@ -879,7 +1112,7 @@ title_slide("🌟", "Using Your Phone to IMPROVE Your Life",
     "Your phone is an incredibly powerful tool.\nLet's use it for good, Elli.",
     "Module 9 — Level Up")
 
-content_slide("🌟", "The Good Stuff", [
+content_slide("🌟", "The Good Stuff", (
     ("💬", "Stay connected — text/call family and friends easily"),
     ("📚", "Learn anything — Khan Academy, YouTube tutorials, podcasts, Duolingo"),
     ("🎨", "Create — CapCut videos, writing with ChatGPT, Pinterest boards, music, art"),
@@ -887,9 +1120,9 @@ content_slide("🌟", "The Good Stuff", [
     ("🆘", "Emergency help — always have a way to reach your parents or call 911"),
     ("🗺️", "Navigate — maps, transit, never get lost"),
     ("🌍", "Be a good digital citizen — spread kindness, support friends, share knowledge"),
-])
+))
 
-content_slide("📱", "Recommended Apps to Start With", [
+content_slide("📱", "Recommended Apps to Start With", (
     ("📚", "Learning: Khan Academy, Duolingo, Google Arts & Culture"),
     ("🎨", "Creativity: CapCut, Canva, GarageBand, Procreate"),
     ("📅", "Organization: Google Calendar, Notion, Reminders"),
@@ -897,7 +1130,7 @@ content_slide("📱", "Recommended Apps to Start With", [
     ("📖", "Reading: Kindle, Libby (free library books!)"),
     ("🎵", "Music: Spotify, Apple Music"),
     ("✍️", "Writing: ChatGPT (for brainstorming!), Google Docs"),
-], note="Fill your phone with tools that help you grow. 🌱")
+), note="Fill your phone with tools that help you grow. 🌱")
 
 discussion_slide("Elli, what are 3 ways you want to use your phone to improve your life? Let's set up those apps together!")
 
@@ -906,7 +1139,7 @@ title_slide("🏁", "Family Agreement & Quiz",
     "Almost there, Elli! Let's review what you've learned\nand make it official.",
     "Module 10 — Final")
 
-content_slide("🔑", "Key Takeaways", [
+content_slide("🔑", "Key Takeaways", (
     ("⏰", "You control your phone — set boundaries and stick to them"),
     ("🛡️", "Never share personal info with strangers online"),
     ("🆘", "If something feels wrong, tell a parent — NO EXCEPTIONS, no trouble"),
@@ -917,7 +1150,7 @@ content_slide("🔑", "Key Takeaways", [
     ("📱", "Social media: private accounts, grandma test, think before you post"),
     ("🔞", "If you see explicit content, close it and tell a parent"),
     ("💚", "Use your phone to connect, learn, create, and grow"),
-])
+))
 
 # Quiz slides
 quiz_slide([
@@ -967,9 +1200,9 @@ quiz_slide([
 
 # Family Agreement
 s = add_slide()
-add_text(s, Inches(0.8), Inches(0.2), Inches(11.733), Inches(0.6),
+add_text(s, _in(0.8), _in(0.2), _in(11.733), _in(0.6),
          "📋 Our Family Phone Agreement", font_size=34, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-add_text(s, Inches(1.0), Inches(0.8), Inches(11.333), Inches(0.4),
+add_text(s, _in(1.0), _in(0.8), _in(11.333), _in(0.4),
          "Elli, let's discuss each item together:", font_size=18, color=DIM, alignment=PP_ALIGN.CENTER)
 
 agreement_items = [
@@ -986,46 +1219,50 @@ agreement_items = [
     "☐  I understand this agreement can be revisited as I show responsibility",
 ]
 
-txBox = s.shapes.add_textbox(Inches(1.2), Inches(1.3), Inches(10.9), Inches(5.5))
-tf = txBox.text_frame
-tf.word_wrap = True
-for i, item in enumerate(agreement_items):
-    if i == 0:
-        p = tf.paragraphs[0]
-    else:
-        p = tf.add_paragraph()
-    p.text = item
-    p.font.size = Pt(15)
-    p.font.color.rgb = WHITE
-    p.font.name = FONT
-    p.space_after = Pt(6)
-    p.space_before = Pt(2)
+# Every item gets the same paragraph properties, so render them once and
+# build the whole text box, all items included, in a single parse.
+agreement_p_head = (
+    '<a:p><a:pPr><a:spcBef><a:spcPts val="%d"/></a:spcBef><a:spcAft><a:spcPts val="%d"/></a:spcAft>'
+    '<a:defRPr sz="%d"><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:defRPr>'
+    '</a:pPr><a:r><a:t>' % (_PT2.centipoints, _PT6.centipoints, _pt(15).centipoints, WHITE)
+)
+add_text_frame(s, _in(1.2), _in(1.3), _in(10.9), _in(5.5),
+               ''.join('%s%s</a:t></a:r></a:p>' % (agreement_p_head, escape(item))
+                       for item in agreement_items))
 
 # Final slide
 s = add_slide()
-add_text(s, Inches(1), Inches(0.8), Inches(11.333), Inches(1.0),
+add_text(s, _in(1), _in(0.8), _in(11.333), _in(1.0),
          "🎉", font_size=72, alignment=PP_ALIGN.CENTER)
-add_text(s, Inches(1), Inches(1.8), Inches(11.333), Inches(1.0),
+add_text(s, _in(1), _in(1.8), _in(11.333), _in(1.0),
          "You Did It, Elli!", font_size=52, color=PURPLE, bold=True, alignment=PP_ALIGN.CENTER)
-add_text(s, Inches(2), Inches(3.0), Inches(9.333), Inches(1.0),
+add_text(s, _in(2), _in(3.0), _in(9.333), _in(1.0),
          "You're officially ready for your phone.", font_size=30, color=WHITE, alignment=PP_ALIGN.CENTER)
-add_text(s, Inches(2), Inches(3.8), Inches(9.333), Inches(1.5),
+add_text(s, _in(2), _in(3.8), _in(9.333), _in(1.5),
          "Remember: your parents are always on your team. Having a phone is a privilege that grows with trust. You've got this! 💪📱\n\nWe're so proud of the smart, responsible person you're becoming.",
          font_size=28, color=DIM, alignment=PP_ALIGN.CENTER)
-add_text(s, Inches(2), Inches(5.5), Inches(9.333), Inches(1.0),
+add_text(s, _in(2), _in(5.5), _in(9.333), _in(1.0),
          "With all our love,\nMom & Dad ❤️", font_size=28, color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
 
 # Save
 output = '/home/ec2-user/.openclaw/workspace/phone-safety-course/Your_First_Phone_Elli.pptx'
 # Remove old file if it exists
-import os as _os2
+import os
 old_file = '/home/ec2-user/.openclaw/workspace/phone-safety-course/Your_First_Phone_Ellianna.pptx'
-if _os2.path.exists(old_file):
-    _os2.remove(old_file)
-prs.save(output)
+try:
+    os.unlink(old_file)
+except FileNotFoundError:
+    pass
+# The zip writer emits many small chunks per part; a 1 MiB buffer batches
+# them into a few large writes at the cost of holding 1 MiB in memory.
+# Write next to the target and rename over it, so anything watching the
+# output only ever sees a finished deck.
+tmp_output = output + '.tmp'
+with open(tmp_output, 'wb', buffering=1 << 20) as f:
+    prs.save(f)
+os.replace(tmp_output, output)
 print(f"Saved to {output}")
 
-import os
 size = os.path.getsize(output)
 print(f"File size: {size:,} bytes ({size/1024:.1f} KB)")
 print(f"Total slides: {slide_number_counter[0]}")